@@ -5,14 +5,30 @@ Batch Video Processing Script
 Process all videos in input folder and save transcriptions to output folder
 """
 
-import glob
+import argparse
+import multiprocessing
 import os
+import queue
 import subprocess
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 from tqdm import tqdm
 
+from src.video_english_recognition import (
+    SAMPLE_RATE,
+    WINDOW_SECONDS,
+    VideoEnglishRecognizer,
+)
+
+# Per-worker Whisper model, loaded once by _init_worker() in each pool process
+_WORKER_MODEL = None
+
+# Recognized video file suffixes, matched case-insensitively
+VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm", ".m4v"}
+
 
 def setup_environment():
     """Setup environment with local FFmpeg"""
@@ -38,91 +54,75 @@ def setup_environment():
 
 def get_video_files(input_folder):
     """Get all video files from input folder"""
-    video_extensions = [".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm", ".m4v"]
-    video_files = []
-
-    for ext in video_extensions:
-        pattern = os.path.join(input_folder, f"*{ext}")
-        video_files.extend(glob.glob(pattern, recursive=False))
-        pattern = os.path.join(input_folder, f"*{ext.upper()}")
-        video_files.extend(glob.glob(pattern, recursive=False))
+    # One scandir pass instead of one glob (and stat walk) per extension;
+    # the lowercased suffix test also means case variants of the same file
+    # can never be collected twice, so no dedupe pass is needed
+    with os.scandir(input_folder) as entries:
+        return sorted(
+            entry.path
+            for entry in entries
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS
+        )
 
-    return sorted(list(set(video_files)))
 
+def _scan_existing_outputs(output_folder):
+    """Snapshot output filenames in one scandir instead of stat-ing per video"""
+    with os.scandir(output_folder) as entries:
+        return {entry.name for entry in entries}
 
-def format_time_srt(seconds):
-    """Convert seconds to SRT time format (HH:MM:SS,mmm)"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
 
+def _already_processed(video_path, existing):
+    """Check whether all three output files already exist for a video"""
+    video_name = Path(video_path).stem
+    return (
+        f"{video_name}_transcription.txt" in existing
+        and f"{video_name}_transcription.json" in existing
+        and f"{video_name}.srt" in existing
+    )
 
-def generate_srt_file(transcription_result, output_path):
-    """Generate SRT subtitle file from transcription result"""
-    try:
-        srt_content = []
 
-        for i, segment in enumerate(transcription_result["segments"], 1):
-            start_time = format_time_srt(segment["start"])
-            end_time = format_time_srt(segment["end"])
-            text = segment["text"].strip()
+def _extract_worker(video_files, audio_queue, existing):
+    """
+    Producer thread: decode audio for the next videos while the main
+    thread runs transcription, so FFmpeg and the model overlap.
 
-            if text:  # Only add non-empty text
-                srt_entry = f"{i}\n{start_time} --> {end_time}\n{text}\n"
-                srt_content.append(srt_entry)
+    Puts (video_path, audio) tuples; audio is None for videos that are
+    already processed (or whose extraction failed), letting the consumer
+    fall back to its normal path.
+    """
+    for video_file in video_files:
+        audio = None
+        if not _already_processed(video_file, existing):
+            audio = VideoEnglishRecognizer.extract_audio_from_video(video_file)
+        audio_queue.put((video_file, audio))
 
-        # Write SRT file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(srt_content))
 
-        return True
-    except Exception as e:
-        print(f"Failed to generate SRT file: {e}")
-        return False
-
-
-def process_single_video(video_path, output_folder, model):
+def process_single_video(video_path, output_folder, model, audio=None, existing=None):
     """Process a single video file"""
     try:
-        from src.video_english_recognition import VideoEnglishRecognizer
+        recognizer = VideoEnglishRecognizer.from_model(model)
 
-        recognizer = VideoEnglishRecognizer(model_size="base")
-        recognizer.model = model  # Reuse loaded model
-
-        # Generate output filename
         video_name = Path(video_path).stem
-        output_file = os.path.join(output_folder, f"{video_name}_transcription.txt")
-        json_file = os.path.join(output_folder, f"{video_name}_transcription.json")
-        srt_file = os.path.join(output_folder, f"{video_name}.srt")
 
         # Check if already processed
-        if (
-            os.path.exists(output_file)
-            and os.path.exists(json_file)
-            and os.path.exists(srt_file)
-        ):
+        if existing is None:
+            existing = _scan_existing_outputs(output_folder)
+        if _already_processed(video_path, existing):
             print(f"Skipping {video_name} (already processed)")
             return True, f"Already processed: {video_name}"
 
         # Process video
         result = recognizer.process_video(
-            video_path, output_dir=output_folder, clean_audio=True
+            video_path, output_dir=output_folder, audio=audio
         )
 
         if result["success"]:
-            # Generate SRT file
-            if generate_srt_file(result["transcription"], srt_file):
-                return (
-                    True,
-                    f"Successfully processed: {video_name} (TXT, JSON, SRT created)",
-                )
-            else:
-                return (
-                    True,
-                    f"Successfully processed: {video_name} (TXT, JSON created, SRT failed)",
-                )
+            # save_transcription already wrote the TXT, JSON and SRT files
+            return (
+                True,
+                f"Successfully processed: {video_name} (TXT, JSON, SRT created)",
+            )
         else:
             return (
                 False,
@@ -133,8 +133,151 @@ def process_single_video(video_path, output_folder, model):
         return False, f"Error processing {Path(video_path).name}: {str(e)}"
 
 
+def _cuda_available():
+    """Check whether torch is installed and sees a CUDA device"""
+    try:
+        import torch
+
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
+
+def _default_max_workers():
+    """Pick a sensible worker count: one per GPU, or half the CPU cores"""
+    if _cuda_available():
+        import torch
+
+        return max(1, torch.cuda.device_count())
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def _make_executor(max_workers, model_size="base"):
+    """
+    Build the process pool for parallel mode.
+
+    On POSIX CPU-only hosts the model is loaded once in the parent and
+    forked workers inherit the weight pages copy-on-write (inference never
+    writes to them), so RAM stays at ~one model instead of one per worker.
+    With CUDA (contexts do not survive fork) or without fork support, each
+    worker loads its own model via the pool initializer.
+    """
+    use_fork = "fork" in multiprocessing.get_all_start_methods() and not _cuda_available()
+
+    if use_fork:
+        print("\nLoading Whisper model (shared with workers via fork)...")
+        _init_worker(model_size)
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(model_size,),
+    )
+
+
+def _init_worker(model_size):
+    """Load the Whisper model once per worker process"""
+    global _WORKER_MODEL
+    import whisper
+
+    _WORKER_MODEL = whisper.load_model(model_size)
+
+
+def process_single_video_worker(args):
+    """Top-level picklable wrapper around process_single_video for pool workers"""
+    video_path, output_folder, existing = args
+    return process_single_video(
+        video_path, output_folder, _WORKER_MODEL, existing=existing
+    )
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Batch Video English Recognition")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Process videos in parallel with a process pool",
+    )
+    parser.add_argument(
+        "--pack-short",
+        action="store_true",
+        help="Pack videos shorter than 30s into shared transcription windows"
+        " (serial mode only)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: one per GPU, or half the CPU cores)",
+    )
+    return parser.parse_args()
+
+
+def process_videos_packed(video_files, output_folder, model, existing=None):
+    """Process videos together, packing short clips into shared 30s windows"""
+    recognizer = VideoEnglishRecognizer.from_model(model)
+    results = []
+    pending = []  # (video_file, audio) for short clips awaiting packed transcription
+
+    if existing is None:
+        existing = _scan_existing_outputs(output_folder)
+
+    def finish_video(video_file, transcription):
+        """Save a finished transcription and report the per-video outcome"""
+        video_name = Path(video_file).stem
+
+        if transcription is None:
+            return (Path(video_file).name, False, f"Failed to transcribe: {video_name}")
+
+        output_file = os.path.join(output_folder, f"{video_name}_transcription.txt")
+        recognizer.save_transcription(transcription, output_file)
+        return (
+            Path(video_file).name,
+            True,
+            f"Successfully processed: {video_name} (TXT, JSON, SRT created)",
+        )
+
+    for video_file in tqdm(video_files, desc="Extracting audio"):
+        video_name = Path(video_file).stem
+
+        if _already_processed(video_file, existing):
+            print(f"Skipping {video_name} (already processed)")
+            results.append((Path(video_file).name, True, f"Already processed: {video_name}"))
+            continue
+
+        audio = recognizer.extract_audio_from_video(video_file)
+        if audio is None:
+            results.append(
+                (Path(video_file).name, False, f"Failed to extract audio: {video_name}")
+            )
+            continue
+
+        # Clips at or over 30s gain nothing from packing; transcribe them
+        # right away so their decoded audio is not held for the whole batch
+        # and only sub-30s clips (a couple of MB each) accumulate
+        if len(audio) >= WINDOW_SECONDS * SAMPLE_RATE:
+            results.append(finish_video(video_file, recognizer.transcribe_audio(audio)))
+            continue
+
+        pending.append((video_file, audio))
+
+    transcriptions = recognizer.transcribe_audios([audio for _, audio in pending])
+
+    for (video_file, _), transcription in zip(pending, transcriptions):
+        results.append(finish_video(video_file, transcription))
+
+    return results
+
+
 def main():
     """Main batch processing function"""
+    args = parse_args()
+
     print("=== Batch Video English Recognition ===")
 
     # Setup environment
@@ -158,7 +301,7 @@ def main():
 
     if not video_files:
         print(f"\nNo video files found in '{input_folder}' folder!")
-        print("Supported formats: .mp4, .avi, .mov, .mkv, .wmv, .flv, .webm, .m4v")
+        print(f"Supported formats: {', '.join(sorted(VIDEO_EXTENSIONS))}")
         print(f"Please add video files to: {os.path.abspath(input_folder)}")
         return
 
@@ -166,32 +309,89 @@ def main():
     for i, video_file in enumerate(video_files, 1):
         print(f"  {i}. {Path(video_file).name}")
 
-    # Load Whisper model once
-    print("\nLoading Whisper model...")
-    try:
-        import whisper
-
-        model = whisper.load_model("base")
-        print("Model loaded successfully!")
-    except Exception as e:
-        print(f"Failed to load Whisper model: {e}")
-        return
+    # One scandir of the output folder replaces three stat calls per video
+    existing = _scan_existing_outputs(output_folder)
 
-    # Process each video
-    print(f"\nProcessing {len(video_files)} videos...")
     results = []
 
-    for video_file in tqdm(video_files, desc="Processing videos"):
-        video_name = Path(video_file).name
-        print(f"\nProcessing: {video_name}")
+    if args.parallel:
+        # Each worker loads its own model, so videos run fully independently
+        max_workers = args.max_workers or _default_max_workers()
+        print(f"\nProcessing {len(video_files)} videos with {max_workers} workers...")
+
+        with _make_executor(max_workers) as executor:
+            futures = {
+                executor.submit(
+                    process_single_video_worker, (video_file, output_folder, existing)
+                ): video_file
+                for video_file in video_files
+            }
+
+            for future in tqdm(
+                as_completed(futures), total=len(futures), desc="Processing videos"
+            ):
+                video_name = Path(futures[future]).name
+                try:
+                    success, message = future.result()
+                except Exception as e:
+                    success, message = False, f"Worker error: {e}"
+                results.append((video_name, success, message))
+
+                if success:
+                    print(f"✓ {message}")
+                else:
+                    print(f"✗ {message}")
+    else:
+        # Load Whisper model once
+        print("\nLoading Whisper model...")
+        try:
+            import whisper
+
+            model = whisper.load_model("base")
+            print("Model loaded successfully!")
+        except Exception as e:
+            print(f"Failed to load Whisper model: {e}")
+            return
+
+        # Process each video
+        print(f"\nProcessing {len(video_files)} videos...")
+
+        if args.pack_short:
+            results = process_videos_packed(
+                video_files, output_folder, model, existing=existing
+            )
+            for video_name, success, message in results:
+                if success:
+                    print(f"✓ {message}")
+                else:
+                    print(f"✗ {message}")
+        else:
+            # Bounded queue keeps at most two decoded audios in flight, so
+            # extraction of video N+1 overlaps transcription of video N
+            audio_queue = queue.Queue(maxsize=2)
+            producer = threading.Thread(
+                target=_extract_worker,
+                args=(video_files, audio_queue, existing),
+                daemon=True,
+            )
+            producer.start()
 
-        success, message = process_single_video(video_file, output_folder, model)
-        results.append((video_name, success, message))
+            for _ in tqdm(range(len(video_files)), desc="Processing videos"):
+                video_file, audio = audio_queue.get()
+                video_name = Path(video_file).name
+                print(f"\nProcessing: {video_name}")
 
-        if success:
-            print(f"✓ {message}")
-        else:
-            print(f"✗ {message}")
+                success, message = process_single_video(
+                    video_file, output_folder, model, audio=audio, existing=existing
+                )
+                results.append((video_name, success, message))
+
+                if success:
+                    print(f"✓ {message}")
+                else:
+                    print(f"✗ {message}")
+
+            producer.join()
 
     # Summary
     print(f"\n{'='*60}")